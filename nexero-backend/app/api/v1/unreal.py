@@ -25,9 +25,15 @@ Endpoints:
 """
 
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends, status
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from app.models.unreal import (
     UnrealSessionData,
@@ -36,58 +42,236 @@ from app.models.unreal import (
 )
 from app.services.session_service import SessionService
 from app.services.tracking_service import TrackingService
+from app.services.bulk_recorder import BulkRecorder
 from app.core.database import SupabaseDB
+from app.core.responses import ORJSONResponse
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Pre-rendered JSON bodies for the hot acknowledgement replies.
+# Only the variable parts are formatted in per request, skipping dict
+# construction, JSON encoding and response validation.
+# Timestamps are datetimes encoded by orjson's native datetime path.
+_RECEIVED_TEMPLATE = b'{"status":"received","timestamp":%s}'
+_BATCH_RECEIVED_TEMPLATE = b'{"status":"received","total_events":%d,"timestamp":%s}'
+_ALIVE_TEMPLATE = b'{"status":"alive","session_id":%s,"timestamp":%s}'
+
+
+@lru_cache(maxsize=4096)
+def _started_at_epoch(started_at: str) -> float:
+    """
+    Parse a session's started_at timestamp to Unix seconds.
+    
+    Cached because Unreal polls the status of the same few active
+    sessions repeatedly, always with the same started_at string.
+    Python 3.11+ fromisoformat accepts the "Z" suffix directly.
+    """
+    return datetime.fromisoformat(started_at).timestamp()
+
+
 # Create router for Unreal Engine endpoints
+# Responses are serialized with orjson instead of stdlib json
 router = APIRouter(
     prefix="/unreal",
-    tags=["Unreal Integration"]
+    tags=["Unreal Integration"],
+    default_response_class=ORJSONResponse
 )
 
 
 # Dependency injection functions
+@lru_cache(maxsize=1)
 def get_database() -> SupabaseDB:
     """
-    Get database instance for dependency injection.
+    Get shared database instance for dependency injection.
+    
+    Cached as a singleton so every request reuses the same pooled
+    Supabase connections instead of opening new ones.
     
     Returns:
-        SupabaseDB: Database connection instance
+        SupabaseDB: Shared database connection instance
     """
     return SupabaseDB()
 
 
-def get_session_service(db: SupabaseDB = Depends(get_database)) -> SessionService:
+@lru_cache(maxsize=1)
+def get_bulk_recorder() -> BulkRecorder:
+    """
+    Get shared bulk write buffer for dependency injection.
+    
+    Started and stopped by the application lifespan.
+    
+    Returns:
+        BulkRecorder: Shared write buffer flushing into the database
+    """
+    db = get_database()
+    
+    # Buffered rows are dumped per request and owned by the recorder
+    return BulkRecorder({
+        "tracking_events": partial(db.insert_tracking_events_batch, copy=False)
+    })
+
+
+@lru_cache(maxsize=1)
+def _session_service() -> SessionService:
+    """Build the shared SessionService once, on first use."""
+    return SessionService(get_database())
+
+
+@lru_cache(maxsize=1)
+def _tracking_service() -> TrackingService:
+    """Build the shared TrackingService once, on first use."""
+    return TrackingService(get_database(), get_bulk_recorder())
+
+
+def reset_dependencies() -> None:
     """
-    Get SessionService instance with database dependency.
+    Forget the shared database, write buffer and services.
+    
+    Called on application shutdown after the database is closed, so a
+    later startup in the same process (e.g. another TestClient) builds
+    fresh instances instead of reusing a closed thread pool.
+    """
+    _tracking_service.cache_clear()
+    _session_service.cache_clear()
+    get_bulk_recorder.cache_clear()
+    get_database.cache_clear()
+
+
+async def get_session_service() -> SessionService:
+    """
+    Get shared SessionService instance for dependency injection.
+    
+    The service only holds the shared database reference, so one
+    instance is reused for every request. Declared async so FastAPI
+    resolves it on the event loop instead of the threadpool.
+    
+    Returns:
+        SessionService: Session management service
+    """
+    return _session_service()
+
+
+async def get_tracking_service() -> TrackingService:
+    """
+    Get shared TrackingService instance for dependency injection.
+    
+    The service only holds the shared database and write buffer,
+    so one instance is reused for every request. Declared async so
+    FastAPI resolves it on the event loop instead of the threadpool.
+    
+    Returns:
+        TrackingService: Tracking event service
+    """
+    return _tracking_service()
+
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Build a dependency that parses the request body into model.
+    
+    Reads the raw body once and validates it with Pydantic's
+    model_validate_json, which parses and validates in a single
+    pass in Rust. FastAPI's built-in body handling decodes the JSON
+    into a dict first and then validates that dict. Errors are
+    reported in FastAPI's usual 422 format. As in FastAPI's own body
+    parsing, malformed JSON is reported without echoing the body back,
+    and bodies that aren't valid UTF-8 are rejected with 400.
+    
+    The model's validator is bound once when the dependency is built,
+    so requests skip the class attribute lookup.
     
     Args:
-        db: Injected database instance
+        model: Pydantic model the body must match
         
     Returns:
-        SessionService: Session management service
+        Dependency callable returning the validated model
     """
-    return SessionService(db)
+    validate = model.model_validate_json
+    
+    async def parse_body(request: Request) -> ModelT:
+        body = await request.body()
+        
+        try:
+            return validate(body)
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            if errors[0]["type"] == "json_invalid":
+                try:
+                    body.decode()
+                except UnicodeDecodeError:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="There was an error parsing the body"
+                    )
+                # "input" would be the raw request bytes
+                raise RequestValidationError(
+                    [{**errors[0], "loc": ("body",), "input": {}}]
+                )
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in errors]
+            )
+    
+    return parse_body
 
 
-def get_tracking_service(db: SupabaseDB = Depends(get_database)) -> TrackingService:
+def json_reply(body: bytes, status_code: int = status.HTTP_200_OK) -> Response:
     """
-    Get TrackingService instance with database dependency.
+    Wrap a pre-rendered JSON body in a Response.
     
     Args:
-        db: Injected database instance
+        body: Encoded JSON body
+        status_code: HTTP status code
         
     Returns:
-        TrackingService: Tracking event service
+        Response: Response sent as-is, bypassing serialization
     """
-    return TrackingService(db)
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
 
-@router.post("/session", status_code=status.HTTP_201_CREATED)
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """
+    Build openapi_extra documenting a json_body() request body.
+    
+    Bodies parsed by json_body() are invisible to FastAPI's schema
+    generation, so the model schema is added to /docs by hand.
+    Nested model definitions are inlined.
+    
+    Args:
+        model: Pydantic model the body must match
+        
+    Returns:
+        dict: Value for the route's openapi_extra parameter
+    """
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+    
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}}
+        }
+    }
+
+
+@router.post(
+    "/session",
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(UnrealSessionData)
+)
 async def receive_session_data(
-    session_data: UnrealSessionData,
+    session_data: UnrealSessionData = Depends(json_body(UnrealSessionData)),
     session_service: SessionService = Depends(get_session_service)
 ):
     """
@@ -123,11 +307,13 @@ async def receive_session_data(
             "property_id": "prop_67890"
         }
     """
+    now = datetime.now(timezone.utc)
+    
     try:
-        logger.info(
-            f"Received session data from Unreal: "
-            f"customer={session_data.customer_id}, "
-            f"property={session_data.property_id}"
+        logger.debug(
+            "Received session data from Unreal: customer=%s, property=%s",
+            session_data.customer_id,
+            session_data.property_id
         )
         
         # Process session data through service layer
@@ -138,38 +324,47 @@ async def receive_session_data(
             property_id=session_data.property_id
         )
         
-        logger.info(
-            f"Successfully processed session {session['id']}: "
-            f"duration={session['duration_seconds']}s"
+        logger.debug(
+            "Successfully processed session %s: duration=%ss",
+            session["id"],
+            session["duration_seconds"]
         )
         
-        return {
-            "status": "success",
-            "message": "Session data received and processed",
-            "session_id": session["id"],
-            "duration_seconds": session["duration_seconds"],
-            "received_at": datetime.now(timezone.utc).isoformat()
-        }
+        # Returned as a response object so FastAPI skips jsonable_encoder
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "message": "Session data received and processed",
+                "session_id": session["id"],
+                "duration_seconds": session["duration_seconds"],
+                "received_at": now
+            },
+            status_code=status.HTTP_201_CREATED
+        )
         
     except ValueError as e:
         # Invalid timestamp format
-        logger.error(f"Invalid timestamp format: {e}")
+        logger.error("Invalid timestamp format: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid timestamp format: {str(e)}"
         )
     except Exception as e:
         # Database or unexpected errors
-        logger.error(f"Error processing session data: {e}", exc_info=True)
+        logger.error("Error processing session data: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process session data"
         )
 
 
-@router.post("/tracking/event", status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/tracking/event",
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(TrackingEventFromUnreal)
+)
 async def receive_tracking_event(
-    event: TrackingEventFromUnreal,
+    event: TrackingEventFromUnreal = Depends(json_body(TrackingEventFromUnreal)),
     tracking_service: TrackingService = Depends(get_tracking_service)
 ):
     """
@@ -178,6 +373,11 @@ async def receive_tracking_event(
     Legacy/fallback endpoint for individual event submission.
     For better performance, use /tracking/batch endpoint instead.
     
+    The event is buffered and written to the database in bulk with
+    other events, so the response does not wait on the insert. If the
+    buffer is full the event is stored inline instead, and if that
+    fails too the endpoint answers 503 so Unreal can retry.
+    
     Request Body:
         - event_type: Event type (gaze, zone_enter, zone_exit, interaction)
         - timestamp: Unix timestamp with milliseconds
@@ -190,6 +390,7 @@ async def receive_tracking_event(
         
     Raises:
         HTTPException 400: Missing session_id or invalid data
+        HTTPException 503: Event could not be buffered or stored
         
     Example Request:
         POST /unreal/tracking/event
@@ -202,6 +403,8 @@ async def receive_tracking_event(
             "dwell_time_ms": 2500
         }
     """
+    now = datetime.now(timezone.utc)
+    
     try:
         # Validate session_id is present
         if not event.session_id:
@@ -212,38 +415,55 @@ async def receive_tracking_event(
             )
         
         logger.debug(
-            f"Received tracking event: session={event.session_id}, "
-            f"type={event.event_type}"
+            "Received tracking event: session=%s, type=%s",
+            event.session_id,
+            event.event_type
         )
         
-        # Convert Pydantic model to dict and log event
+        # Convert Pydantic model to dict and buffer for bulk insert
         event_dict = event.model_dump()
-        await tracking_service.log_event(
+        buffered = tracking_service.enqueue_event(
             session_id=event.session_id,
             event_data=event_dict
         )
         
-        # Minimal response for speed
-        return {
-            "status": "received",
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        # Buffer full: store inline rather than silently dropping the event
+        if not buffered and not await tracking_service.log_event(
+            session_id=event.session_id,
+            event_data=event_dict
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Tracking event could not be stored, retry later",
+                headers={"Retry-After": "1"}
+            )
+        
+        # Minimal pre-rendered response for speed
+        return json_reply(
+            _RECEIVED_TEMPLATE % orjson.dumps(now),
+            status.HTTP_202_ACCEPTED
+        )
         
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
         # Log error but return success (defensive - don't break VR client)
-        logger.error(f"Error processing tracking event: {e}", exc_info=True)
-        return {
-            "status": "received",
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        logger.error("Error processing tracking event: %s", e, exc_info=True)
+        return json_reply(
+            _RECEIVED_TEMPLATE % orjson.dumps(now),
+            status.HTTP_202_ACCEPTED
+        )
 
 
-@router.post("/tracking/batch", status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/tracking/batch",
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(TrackingBatchFromUnreal)
+)
 async def receive_tracking_batch(
-    batch: TrackingBatchFromUnreal,
+    background_tasks: BackgroundTasks,
+    batch: TrackingBatchFromUnreal = Depends(json_body(TrackingBatchFromUnreal)),
     tracking_service: TrackingService = Depends(get_tracking_service)
 ):
     """
@@ -253,6 +473,12 @@ async def receive_tracking_batch(
     Unreal sends all collected tracking events in a single batch
     for efficient processing.
     
+    The batch is stored in a background task after the response is
+    sent, so Unreal only waits for validation, not the database insert.
+    Storage results are reported in the backend logs. If too many events
+    are already waiting to be stored, the batch is stored before the
+    response instead, slowing clients down rather than growing memory.
+    
     Benefits:
     - Reduces network overhead (single HTTP request)
     - Faster processing with bulk database operations
@@ -265,10 +491,7 @@ async def receive_tracking_batch(
     
     Response:
         - status: "received"
-        - total_events: Total events in batch
-        - processed: Successfully stored events
-        - failed: Failed events (if any)
-        - success_rate: Percentage of successful storage
+        - total_events: Total events accepted for storage
         - timestamp: Current server time
         
     Example Request:
@@ -283,46 +506,31 @@ async def receive_tracking_batch(
             ]
         }
     """
-    try:
-        logger.info(
-            f"Received tracking batch: session={batch.session_id}, "
-            f"events_count={len(batch.events)}"
-        )
-        
-        # Convert Pydantic models to dicts
-        events_list = [event.model_dump() for event in batch.events]
-        
-        # Process batch through tracking service
-        result = await tracking_service.log_events_batch(
+    now = datetime.now(timezone.utc)
+    
+    logger.debug(
+        "Received tracking batch: session=%s, events_count=%d",
+        batch.session_id,
+        len(batch.events)
+    )
+    
+    # Store batch after the response is sent (service logs the results)
+    if tracking_service.reserve_background_batch(len(batch.events)):
+        background_tasks.add_task(
+            tracking_service.store_background_batch,
             session_id=batch.session_id,
-            events=events_list
+            events=batch.events
         )
-        
-        logger.info(
-            f"Batch processed: {result['successful_count']}/{result['total_events']} "
-            f"events stored ({result['success_rate']:.1f}% success)"
+    else:
+        await tracking_service.log_events_batch(
+            session_id=batch.session_id,
+            events=batch.events
         )
-        
-        return {
-            "status": "received",
-            "total_events": result["total_events"],
-            "processed": result["successful_count"],
-            "failed": result["failed_count"],
-            "success_rate": result["success_rate"],
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        
-    except Exception as e:
-        # Log error but return partial success (defensive)
-        logger.error(f"Error processing tracking batch: {e}", exc_info=True)
-        return {
-            "status": "received",
-            "total_events": len(batch.events),
-            "processed": 0,
-            "failed": len(batch.events),
-            "success_rate": 0.0,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+    
+    return json_reply(
+        _BATCH_RECEIVED_TEMPLATE % (len(batch.events), orjson.dumps(now)),
+        status.HTTP_202_ACCEPTED
+    )
 
 
 @router.get("/session/{session_id}/status")
@@ -351,29 +559,24 @@ async def get_session_status(
         GET /unreal/session/session_abc123/status
     """
     try:
-        logger.debug(f"Status check requested for session {session_id}")
+        logger.debug("Status check requested for session %s", session_id)
         
         # Fetch session from database
         session = await session_service.get_session(session_id)
         
         if not session:
-            logger.warning(f"Session not found: {session_id}")
-            return {
+            logger.warning("Session not found: %s", session_id)
+            return ORJSONResponse({
                 "session_id": session_id,
                 "status": "not_found",
                 "started_at": None,
                 "duration_so_far": None
-            }
+            })
         
         # Calculate duration for active sessions
         duration_so_far = None
         if session["status"] == "active":
-            started_at = datetime.fromisoformat(
-                session["started_at"].replace("Z", "+00:00")
-            )
-            current_time = datetime.now(timezone.utc)
-            duration_delta = current_time - started_at
-            duration_so_far = int(duration_delta.total_seconds())
+            duration_so_far = int(time.time() - _started_at_epoch(session["started_at"]))
         
         response = {
             "session_id": session["id"],
@@ -387,10 +590,11 @@ async def get_session_status(
             response["ended_at"] = session["ended_at"]
             response["duration_seconds"] = session.get("duration_seconds")
         
-        return response
+        # Returned as a response object so FastAPI skips jsonable_encoder
+        return ORJSONResponse(response)
         
     except Exception as e:
-        logger.error(f"Error checking session status: {e}", exc_info=True)
+        logger.error("Error checking session status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve session status"
@@ -424,8 +628,10 @@ async def session_heartbeat(
     Example Request:
         POST /unreal/session/session_abc123/heartbeat
     """
+    now = datetime.now(timezone.utc)
+    
     try:
-        logger.debug(f"Heartbeat received for session {session_id}")
+        logger.debug("Heartbeat received for session %s", session_id)
         
         # Verify session exists
         session = await session_service.get_session(session_id)
@@ -442,16 +648,15 @@ async def session_heartbeat(
         #     {"last_activity": datetime.now(timezone.utc)}
         # )
         
-        return {
-            "status": "alive",
-            "session_id": session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        # session_id comes from the URL, so encode it as a JSON string
+        return json_reply(
+            _ALIVE_TEMPLATE % (orjson.dumps(session_id), orjson.dumps(now))
+        )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing heartbeat: {e}", exc_info=True)
+        logger.error("Error processing heartbeat: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process heartbeat"
@@ -11,6 +11,22 @@ Environment Variables:
 - LOG_LEVEL: Logging level (debug/info/warning/error)
 - CORS_ORIGINS: List of allowed CORS origins (comma-separated)
 - API_VERSION: API version string
+- SUPABASE_MAX_CONNECTIONS: Max pooled HTTP connections to Supabase
+- SUPABASE_MAX_KEEPALIVE: Max idle keep-alive connections kept in the pool
+- SUPABASE_KEEPALIVE_EXPIRY: Seconds before an idle pooled connection is recycled
+- SUPABASE_TIMEOUT_SECONDS: Max seconds to wait on a Supabase response
+- SUPABASE_CONNECT_TIMEOUT_SECONDS: Max seconds to open a Supabase connection
+- BULK_RECORDER_SIZE: Max rows per bulk insert from the write buffer
+- BULK_RECORDER_FLUSH_MS: Max milliseconds a buffered row waits before flushing
+- BULK_RECORDER_QUEUE_SIZE: Max buffered rows per table before new rows are dropped
+- SESSION_CACHE_TTL_SECONDS: How long looked-up sessions are served from memory
+- SESSION_CACHE_MAX_SIZE: Max sessions kept in the in-memory cache
+- REQUEST_BODY_TIMEOUT_SECONDS: Max seconds to receive a buffered upload body
+- REQUEST_BODY_IDLE_TIMEOUT_SECONDS: Max seconds between chunks of an upload body
+- REQUEST_BODY_MAX_BYTES: Max size of a buffered upload body
+- TRACKING_BACKLOG_MAX_EVENTS: Max batch events awaiting background storage
+- TRACKING_INSERT_CHUNK_SIZE: Max tracking events per insert request body
+- INSERT_FALLBACK_CONCURRENCY: Max per-row retry inserts in flight at once
 
 Usage:
     from app.config import get_settings
@@ -36,6 +52,30 @@ class Settings(BaseSettings):
     SUPABASE_URL: str
     SUPABASE_KEY: str  # Service role key for backend operations
     
+    # Supabase HTTP connection pool (shared by all requests)
+    SUPABASE_MAX_CONNECTIONS: int = 120
+    SUPABASE_MAX_KEEPALIVE: int = 80
+    SUPABASE_KEEPALIVE_EXPIRY: float = 300.0
+    SUPABASE_TIMEOUT_SECONDS: float = 120.0
+    SUPABASE_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    
+    # Bulk write buffer for fire-and-forget inserts
+    BULK_RECORDER_SIZE: int = 500
+    BULK_RECORDER_FLUSH_MS: int = 100
+    BULK_RECORDER_QUEUE_SIZE: int = 10000
+    TRACKING_BACKLOG_MAX_EVENTS: int = 100000
+    TRACKING_INSERT_CHUNK_SIZE: int = 1000
+    INSERT_FALLBACK_CONCURRENCY: int = 8
+    
+    # In-memory session cache for heartbeat/status lookups
+    SESSION_CACHE_TTL_SECONDS: float = 30.0
+    SESSION_CACHE_MAX_SIZE: int = 4096
+    
+    # Upload buffering for slow VR clients (session/batch uploads)
+    REQUEST_BODY_TIMEOUT_SECONDS: float = 120.0
+    REQUEST_BODY_IDLE_TIMEOUT_SECONDS: float = 5.0
+    REQUEST_BODY_MAX_BYTES: int = 10 * 1024 * 1024
+    
     # Application Configuration
     ENVIRONMENT: str = "development"
     LOG_LEVEL: str = "info"
@@ -8,6 +8,12 @@ Database Tables:
 - vr_sessions: Session metadata (start/end times, customer, property)
 - tracking_events: Individual tracking events (gaze, zones, interactions)
 
+Connection Pooling:
+- A single httpx client with keep-alive is shared by all queries, so the
+  TCP/TLS handshake to Supabase is paid once rather than per request
+- Pool size and idle recycling are configured via SUPABASE_MAX_CONNECTIONS,
+  SUPABASE_MAX_KEEPALIVE and SUPABASE_KEEPALIVE_EXPIRY
+
 Usage:
     from app.core.database import SupabaseDB
     
@@ -16,15 +22,59 @@ Usage:
     await db.insert_tracking_events_batch(events)
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Any
-from supabase import create_client, Client
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, TypeVar
+
+import httpx
+import orjson
+from postgrest.types import ReturnMethod
+from supabase import create_client, Client, ClientOptions
 from app.config import get_settings
 from datetime import datetime, timezone
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Unix timestamp sent as a string, e.g. "1759479689" or "1759479689.384"
+_NUMERIC_TIMESTAMP_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)")
+
+
+# Events in a batch often share timestamps, so recent conversions are cached
+@lru_cache(maxsize=4096)
+def _iso_from_epoch(value: float) -> str:
+    """Convert a Unix timestamp (seconds) to an ISO 8601 string."""
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+def _iso_from_datetime(value: datetime) -> str:
+    """Convert a datetime (naive values assumed UTC) to an ISO 8601 string."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _iso_from_str(value: str) -> str:
+    """Convert a numeric string to ISO 8601; pass ISO strings through."""
+    if _NUMERIC_TIMESTAMP_RE.fullmatch(value):
+        return _iso_from_epoch(float(value))
+    return value  # Already ISO format
+
+
+# Timestamp converters keyed by exact input type (one dict lookup per event)
+_TIMESTAMP_CONVERTERS = {
+    float: _iso_from_epoch,
+    int: _iso_from_epoch,
+    str: _iso_from_str,
+    datetime: _iso_from_datetime,
+}
+
 
 def _convert_timestamp_to_iso(value: Any) -> str:
     """
@@ -35,38 +85,64 @@ def _convert_timestamp_to_iso(value: Any) -> str:
     - ISO string: "2025-10-03T08:21:25+00:00"
     - datetime object
     
+    Dispatches on the exact input type via _TIMESTAMP_CONVERTERS,
+    falling back to isinstance checks for subclasses.
+    
     Args:
         value: Timestamp in various formats
         
     Returns:
         str: ISO 8601 formatted timestamp string
     """
-    # Already a string in ISO format
-    if isinstance(value, str):
-        # If it's a numeric string, convert to float first
-        try:
-            if '.' in value or value.isdigit():
-                value = float(value)
-            else:
-                return value  # Already ISO format
-        except ValueError:
-            return value  # Already ISO format
+    converter = _TIMESTAMP_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
     
-    # Unix timestamp (float or int)
-    if isinstance(value, (int, float)):
-        dt = datetime.fromtimestamp(value, tz=timezone.utc)
-        return dt.isoformat()
-    
-    # datetime object
+    # Subclasses of the supported types
+    if isinstance(value, str):
+        return _iso_from_str(value)
     if isinstance(value, datetime):
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=timezone.utc)
-        return value.isoformat()
+        return _iso_from_datetime(value)
+    if isinstance(value, (int, float)):
+        return _iso_from_epoch(value)
     
     # Fallback: return as-is
     return str(value)
 
 
+def _prepare_tracking_event(event: dict, copy: bool = True) -> dict:
+    """
+    Normalize a tracking event's timestamp to ISO 8601.
+    
+    The event is only copied when its timestamp actually changes, so
+    events without a timestamp or already carrying an ISO string are
+    passed through without allocating a new dict.
+    
+    Args:
+        event: Event dictionary from the service layer
+        copy: Work on a copy (True) or update the event in place (False)
+        
+    Returns:
+        dict: Event ready for insertion
+    """
+    if "timestamp" not in event:
+        return event
+    timestamp = event["timestamp"]
+    iso_timestamp = _convert_timestamp_to_iso(timestamp)
+    # Compare by value: the cached converters may hand back an equal copy
+    if iso_timestamp == timestamp:
+        return event
+    event_copy = event.copy() if copy else event
+    event_copy["timestamp"] = iso_timestamp
+    return event_copy
+
+
+def _first_row(response: Any) -> Optional[dict]:
+    """Return the first row of a PostgREST response, or None if it has none."""
+    data = response.data
+    return data[0] if data else None
+
+
 class SupabaseDB:
     """
     Database wrapper for Supabase operations.
@@ -75,8 +151,19 @@ class SupabaseDB:
     tracking events. Handles errors gracefully and logs all database
     operations for debugging and monitoring.
     
+    The Supabase client is synchronous, so every query is executed on a
+    worker thread (see _run) to keep the event loop free while waiting
+    on the network. Queries get their own thread pool, sized to the
+    HTTP connection pool, so database concurrency isn't capped by
+    asyncio's small default executor.
+    
     Attributes:
         client: Supabase client instance
+        http_client: Pooled httpx client shared by all Supabase queries
+        executor: Worker threads that run the blocking Supabase calls
+        rest_url: PostgREST base URL used for orjson-encoded inserts
+        insert_chunk_size: Max tracking events sent in one insert request
+        fallback_limit: Caps per-row retry inserts in flight across all batches
     """
     
     def __init__(self):
@@ -84,14 +171,99 @@ class SupabaseDB:
         Initialize Supabase database connection.
         
         Loads configuration from environment variables and creates
-        a Supabase client instance for database operations.
+        a Supabase client instance backed by a pooled keep-alive
+        httpx client. Idle connections are recycled after
+        SUPABASE_KEEPALIVE_EXPIRY seconds.
+        
+        postgrest ignores its own timeout and redirect settings when a
+        client is injected, so they are set on the httpx client: large
+        batch inserts get SUPABASE_TIMEOUT_SECONDS (httpx would default
+        to 5 seconds and retry inserts that had already committed).
         """
         settings = get_settings()
+        self.http_client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(
+                settings.SUPABASE_TIMEOUT_SECONDS,
+                connect=settings.SUPABASE_CONNECT_TIMEOUT_SECONDS
+            ),
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE,
+                keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY
+            )
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.SUPABASE_MAX_CONNECTIONS,
+            thread_name_prefix="supabase"
+        )
+        self.insert_chunk_size = settings.TRACKING_INSERT_CHUNK_SIZE
+        self.fallback_limit = asyncio.Semaphore(settings.INSERT_FALLBACK_CONCURRENCY)
+        self.rest_url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1"
+        self._insert_headers = {
+            "apikey": settings.SUPABASE_KEY,
+            "Authorization": f"Bearer {settings.SUPABASE_KEY}",
+            "Content-Type": "application/json",
+            "Prefer": "return=minimal"
+        }
         self.client: Client = create_client(
             supabase_url=settings.SUPABASE_URL,
-            supabase_key=settings.SUPABASE_KEY
+            supabase_key=settings.SUPABASE_KEY,
+            options=ClientOptions(httpx_client=self.http_client)
+        )
+        logger.info(
+            f"Supabase database connection initialized "
+            f"(pool: max_connections={settings.SUPABASE_MAX_CONNECTIONS}, "
+            f"max_keepalive={settings.SUPABASE_MAX_KEEPALIVE})"
         )
-        logger.info("Supabase database connection initialized")
+    
+    async def warm_up(self) -> bool:
+        """
+        Open a pooled connection to Supabase ahead of the first request.
+        
+        Runs one tiny query so the TCP/TLS/HTTP2 handshake happens at
+        startup instead of on the first VR request. Failures are logged,
+        not raised, so a slow database never blocks startup.
+        
+        Returns:
+            bool: True if Supabase answered, False otherwise
+        """
+        try:
+            await self._run(
+                self.client.table("vr_sessions").select("id").limit(1).execute
+            )
+            logger.info("Supabase connection pool warmed up")
+            return True
+        except Exception as e:
+            logger.warning(f"Supabase warm-up query failed: {e}")
+            return False
+    
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking Supabase call on the query thread pool.
+        
+        Args:
+            func: Blocking callable, e.g. a built query's execute
+            *args: Positional arguments for func
+        
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+    
+    async def close(self) -> None:
+        """
+        Close the pooled HTTP connections to Supabase.
+        
+        Called once on application shutdown, after the bulk recorder has
+        drained. Waiting for in-flight queries to finish happens on a
+        separate thread, so the event loop keeps serving while they do.
+        """
+        await asyncio.to_thread(self.executor.shutdown, wait=True)
+        self.http_client.close()
+        logger.info("Supabase database connection closed")
     
     async def create_session(self, session_data: dict) -> Optional[dict]:
         """
@@ -100,6 +272,10 @@ class SupabaseDB:
         Inserts session metadata when a VR tour starts. This creates
         the parent record that tracking events will link to.
         
+        The stored row is returned by the insert itself
+        (Prefer: return=representation), so no follow-up SELECT
+        is needed.
+        
         Args:
             session_data: Dictionary containing session fields:
                 - id: Session UUID
@@ -121,9 +297,15 @@ class SupabaseDB:
             session = await db.create_session(session_data)
         """
         try:
-            response = self.client.table("vr_sessions").insert(session_data).execute()
-            logger.info(f"Created VR session: {response.data}")
-            return response.data[0] if response.data else None
+            response = await self._run(
+                self.client.table("vr_sessions").insert(
+                    session_data,
+                    returning=ReturnMethod.representation
+                ).execute
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Created VR session: {response.data}")
+            return _first_row(response)
         except Exception as e:
             logger.error(f"Failed to create session: {e}", exc_info=True)
             return None
@@ -147,14 +329,15 @@ class SupabaseDB:
             updated = await db.update_session("session_abc123", updates)
         """
         try:
-            response = (
+            response = await self._run(
                 self.client.table("vr_sessions")
                 .update(updates)
                 .eq("id", session_id)
-                .execute()
+                .execute
             )
-            logger.info(f"Updated session {session_id}: {updates}")
-            return response.data[0] if response.data else None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Updated session {session_id}: {updates}")
+            return _first_row(response)
         except Exception as e:
             logger.error(f"Failed to update session {session_id}: {e}", exc_info=True)
             return None
@@ -178,13 +361,13 @@ class SupabaseDB:
                 print(f"Session started: {session['started_at']}")
         """
         try:
-            response = (
+            response = await self._run(
                 self.client.table("vr_sessions")
                 .select("*")
                 .eq("id", session_id)
-                .execute()
+                .execute
             )
-            return response.data[0] if response.data else None
+            return _first_row(response)
         except Exception as e:
             logger.error(f"Failed to get session {session_id}: {e}", exc_info=True)
             return None
@@ -219,19 +402,22 @@ class SupabaseDB:
             success = await db.insert_tracking_event(event)
         """
         try:
-            # Convert timestamp to ISO format if needed
-            event_copy = event.copy()
-            if "timestamp" in event_copy:
-                event_copy["timestamp"] = _convert_timestamp_to_iso(event_copy["timestamp"])
-            
-            self.client.table("tracking_events").insert(event_copy).execute()
-            logger.debug(f"Inserted tracking event: {event.get('event_type')}")
+            await self._run(
+                self._execute_insert,
+                "tracking_events",
+                _prepare_tracking_event(event)
+            )
+            logger.debug("Inserted tracking event: %s", event.get("event_type"))
             return True
         except Exception as e:
             logger.error(f"Failed to insert tracking event: {e}", exc_info=True)
             return False
     
-    async def insert_tracking_events_batch(self, events: List[dict]) -> int:
+    async def insert_tracking_events_batch(
+        self,
+        events: List[dict],
+        copy: bool = True
+    ) -> int:
         """
         Insert multiple tracking events efficiently in a batch.
         
@@ -239,8 +425,15 @@ class SupabaseDB:
         Continues processing even if individual events fail, ensuring
         maximum data capture during VR sessions.
         
+        Batches larger than TRACKING_INSERT_CHUNK_SIZE are split into
+        bounded request bodies that are inserted concurrently, each
+        with its own per-row fallback.
+        
         Args:
             events: List of event dictionaries to insert
+            copy: Set to False when the caller owns freshly built event
+                dicts, so timestamps are normalized in place instead of
+                copying every event first
         
         Returns:
             int: Count of successfully inserted events
@@ -254,44 +447,114 @@ class SupabaseDB:
             print(f"Inserted {count} of {len(events)} events")
         """
         try:
-            # Convert timestamps in all events
-            events_copy = []
-            for event in events:
-                event_copy = event.copy()
-                if "timestamp" in event_copy:
-                    event_copy["timestamp"] = _convert_timestamp_to_iso(event_copy["timestamp"])
-                events_copy.append(event_copy)
-            
-            # Try batch insert first (most efficient)
-            try:
-                self.client.table("tracking_events").insert(events_copy).execute()
-                logger.info(f"Batch inserted {len(events_copy)} events")
-                return len(events_copy)
-            except Exception as batch_error:
-                logger.warning(
-                    f"Batch insert failed, trying individual inserts: {batch_error}"
-                )
-            
-            # Fallback: Insert events individually
-            successful_count = 0
-            for event in events_copy:
-                try:
-                    self.client.table("tracking_events").insert(event).execute()
-                    successful_count += 1
-                except Exception as individual_error:
-                    logger.error(
-                        f"Failed to insert individual event: {individual_error}"
-                    )
-                    # Continue processing remaining events
-                    continue
-            
-            logger.info(f"Individually inserted {successful_count}/{len(events_copy)} events")
-            return successful_count
+            rows = [_prepare_tracking_event(event, copy) for event in events]
+            chunk_size = self.insert_chunk_size
+            if len(rows) <= chunk_size:
+                return await self._insert_with_fallback("tracking_events", rows)
             
+            # Large batch: several bounded inserts over the pool at once
+            results = await asyncio.gather(*(
+                self._insert_with_fallback("tracking_events", rows[i:i + chunk_size])
+                for i in range(0, len(rows), chunk_size)
+            ))
+            return sum(results)
         except Exception as e:
             logger.error(f"Critical error in batch insert: {e}", exc_info=True)
             return 0
     
+    async def _insert_with_fallback(self, table: str, rows: List[dict]) -> int:
+        """
+        Insert rows in one request, falling back to per-row inserts.
+        
+        If the multi-row insert fails (e.g. one malformed row), each row
+        is retried on its own so the valid ones are still stored. The
+        per-row inserts run concurrently on worker threads, but at most
+        INSERT_FALLBACK_CONCURRENCY at a time across all batches, so one
+        bad row in a large batch can't flood the query thread pool and
+        stall session, heartbeat and status queries.
+        
+        Inserts ask for return=minimal: the stored rows are not echoed
+        back, so large batches aren't decoded into a dict per row only
+        to be thrown away. Both the multi-row and the per-row request
+        bodies are encoded with orjson (see _execute_insert).
+        
+        Args:
+            table: Target table name
+            rows: Rows ready for insertion
+        
+        Returns:
+            int: Count of successfully inserted rows
+        """
+        # Try batch insert first (most efficient)
+        try:
+            await self._run(self._execute_insert, table, rows)
+            logger.debug("Batch inserted %d rows into %s", len(rows), table)
+            return len(rows)
+        except Exception as batch_error:
+            logger.warning(
+                f"Batch insert into {table} failed, trying individual inserts: "
+                f"{batch_error}"
+            )
+        
+        def insert_one(row: dict) -> bool:
+            try:
+                self._execute_insert(table, row)
+                return True
+            except Exception as individual_error:
+                logger.error(f"Failed to insert individual row into {table}: {individual_error}")
+                return False
+        
+        async def insert_one_limited(row: dict) -> bool:
+            async with self.fallback_limit:
+                return await self._run(insert_one, row)
+        
+        # Fallback: insert rows individually, a bounded number at a time
+        results = await asyncio.gather(
+            *(insert_one_limited(row) for row in rows)
+        )
+        successful_count = sum(results)
+        
+        logger.info(f"Individually inserted {successful_count}/{len(rows)} rows into {table}")
+        return successful_count
+    
+    def _execute_insert(self, table: str, rows: Any) -> None:
+        """
+        POST rows to PostgREST with the body encoded by orjson.
+        
+        postgrest-py hands the rows to httpx as json=, which encodes
+        them with the stdlib json module. For large batches that
+        encoding dominates, so tracking inserts are sent here directly
+        on the shared pooled httpx client, using PostgREST's documented
+        HTTP interface (Prefer: return=minimal, and a columns parameter
+        for multi-row bodies, as postgrest-py sends).
+        
+        Args:
+            table: Target table name
+            rows: A single row dict or a list of rows
+        
+        Raises:
+            httpx.HTTPStatusError: If PostgREST rejects the insert
+        """
+        params = None
+        if isinstance(rows, list):
+            # Rows missing a column get null, matching postgrest-py bulk inserts
+            columns = dict.fromkeys(key for row in rows for key in row)
+            params = {"columns": ",".join(f'"{column}"' for column in columns)}
+        
+        response = self.http_client.post(
+            f"{self.rest_url}/{table}",
+            content=orjson.dumps(rows),
+            params=params,
+            headers=self._insert_headers
+        )
+        if not response.is_success:
+            raise httpx.HTTPStatusError(
+                f"Insert into {table} failed "
+                f"({response.status_code}): {response.text}",
+                request=response.request,
+                response=response
+            )
+    
     async def get_session_events(self, session_id: str) -> List[dict]:
         """
         Retrieve all tracking events for a specific session.
@@ -312,12 +575,12 @@ class SupabaseDB:
                 print(f"{event['timestamp']}: {event['event_type']}")
         """
         try:
-            response = (
+            response = await self._run(
                 self.client.table("tracking_events")
                 .select("*")
                 .eq("session_id", session_id)
                 .order("timestamp", desc=False)
-                .execute()
+                .execute
             )
             logger.info(f"Retrieved {len(response.data)} events for session {session_id}")
             return response.data if response.data else []
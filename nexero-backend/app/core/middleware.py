@@ -0,0 +1,312 @@
+"""
+ASGI middleware for Nexero VR backend.
+
+This module contains request-level middleware that runs before FastAPI
+routing. It is registered in app/main.py.
+
+Middleware:
+- GZipRequestMiddleware: Accepts gzip-compressed request bodies
+  (Content-Encoding: gzip) on the configured paths so Unreal can upload
+  large tracking batches compressed. JSON event batches typically shrink
+  ~8x. The inflated size is capped, so a small "gzip bomb" can't expand
+  into gigabytes in memory.
+- BufferedBodyMiddleware: Reads upload bodies fully, with an idle timeout,
+  an overall deadline and a size cap, before the route handler runs, so
+  slow VR clients on weak networks never hold a database slot while they
+  upload.
+
+Usage:
+    from app.core.middleware import BufferedBodyMiddleware, GZipRequestMiddleware
+    
+    app.add_middleware(GZipRequestMiddleware, paths=("/api/v1/unreal/tracking/batch",))
+    app.add_middleware(BufferedBodyMiddleware, paths=("/api/v1/unreal/tracking/batch",))
+"""
+
+import asyncio
+import logging
+import zlib
+from typing import Iterable, List, Optional
+
+from starlette.requests import ClientDisconnect
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Headers describing the original compressed body, replaced after inflating
+_COMPRESSED_BODY_HEADERS = frozenset((b"content-encoding", b"content-length"))
+
+
+async def _reject(
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    status_code: int,
+    detail: str
+) -> None:
+    """Send a JSON error response without calling the handler."""
+    response = JSONResponse({"detail": detail}, status_code=status_code)
+    await response(scope, receive, send)
+
+
+class GZipRequestMiddleware:
+    """
+    Transparently decompress gzip-encoded request bodies.
+    
+    Only requests to the configured paths that carry Content-Encoding:
+    gzip are inflated; everything else passes through untouched. The
+    body is inflated as it streams in, and the handler sees a plain
+    body with Content-Encoding removed and Content-Length updated.
+    
+    Corrupt gzip data is rejected with 400, and bodies that inflate
+    beyond max_bytes with 413 as soon as the limit is crossed, before
+    the rest is decompressed.
+    
+    Attributes:
+        app: Wrapped ASGI application
+        paths: Exact request paths that accept gzip bodies
+        max_bytes: Maximum size of the inflated body
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        max_bytes: int = 10 * 1024 * 1024
+    ):
+        """
+        Initialize middleware around an ASGI application.
+        
+        Args:
+            app: ASGI application to wrap
+            paths: Exact request paths that accept gzip bodies
+            max_bytes: Maximum size of the inflated body
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+        self.max_bytes = max_bytes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if (
+            scope["type"] != "http"
+            or scope["path"] not in self.paths
+            or not self._is_gzip(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            chunks = await self._inflate_body(receive)
+        except zlib.error as e:
+            logger.warning(f"Rejected invalid gzip request body on {scope['path']}: {e}")
+            await _reject(scope, receive, send, 400, "Invalid gzip request body")
+            return
+        except ClientDisconnect:
+            return
+        
+        if chunks is None:
+            logger.warning(
+                f"Rejected gzip request body on {scope['path']}: "
+                f"inflates beyond {self.max_bytes} bytes"
+            )
+            await _reject(scope, receive, send, 413, "Request body too large")
+            return
+        
+        # Present the decompressed body as a plain JSON upload
+        body = b"".join(chunks)
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in _COMPRESSED_BODY_HEADERS
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        scope = dict(scope, headers=headers)
+        
+        body_sent = False
+        
+        async def receive_decompressed() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        
+        await self.app(scope, receive_decompressed, send)
+    
+    async def _inflate_body(self, receive: Receive) -> Optional[List[bytes]]:
+        """
+        Receive and inflate the full gzip request body.
+        
+        Each decompress call is bounded by the remaining byte budget, so
+        memory use never exceeds max_bytes no matter how well the input
+        compresses.
+        
+        Args:
+            receive: ASGI receive channel
+        
+        Returns:
+            list: Inflated body chunks, or None if the body inflates
+                beyond max_bytes
+        
+        Raises:
+            zlib.error: Body is not valid gzip data
+            ClientDisconnect: Client went away before finishing the upload
+        """
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = []
+        size = 0
+        more_body = True
+        
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            data = message.get("body", b"")
+            while data:
+                # One byte past the budget is enough to detect an overflow
+                chunk = decompressor.decompress(data, self.max_bytes - size + 1)
+                size += len(chunk)
+                if size > self.max_bytes:
+                    return None
+                chunks.append(chunk)
+                data = decompressor.unconsumed_tail
+            more_body = message.get("more_body", False)
+        
+        chunk = decompressor.flush()
+        size += len(chunk)
+        if size > self.max_bytes:
+            return None
+        chunks.append(chunk)
+        
+        return chunks
+    
+    @staticmethod
+    def _is_gzip(scope: Scope) -> bool:
+        """Return True if the request declares Content-Encoding: gzip."""
+        for name, value in scope["headers"]:
+            if name == b"content-encoding":
+                return value.strip().lower() == b"gzip"
+        return False
+
+
+class BufferedBodyMiddleware:
+    """
+    Buffer request bodies in full before dispatching to the handler.
+    
+    For the configured paths, the whole body is received up front.
+    Handlers then run against an in-memory body, so any database work
+    starts only once the upload has finished.
+    
+    A client that goes quiet for idle_timeout between chunks is cut off,
+    while one that keeps sending may take up to timeout for the whole
+    body, so a full-size batch still arrives over a slow link. Bodies
+    larger than max_bytes are rejected with 413, and stalled or overdue
+    uploads with 408. Other paths pass through untouched.
+    
+    Attributes:
+        app: Wrapped ASGI application
+        paths: Exact request paths whose bodies are buffered
+        max_bytes: Maximum accepted body size
+        timeout: Seconds allowed to receive the whole body
+        idle_timeout: Seconds allowed between body chunks
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        max_bytes: int = 10 * 1024 * 1024,
+        timeout: float = 120.0,
+        idle_timeout: float = 5.0
+    ):
+        """
+        Initialize middleware around an ASGI application.
+        
+        Args:
+            app: ASGI application to wrap
+            paths: Exact request paths whose bodies are buffered
+            max_bytes: Maximum accepted body size
+            timeout: Seconds allowed to receive the whole body
+            idle_timeout: Seconds allowed between body chunks
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        
+        # Reject oversized uploads before reading them when declared up front
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_bytes:
+                    await _reject(scope, receive, send, 413, "Request body too large")
+                    return
+                break
+        
+        try:
+            chunks = await self._read_body(receive)
+        except asyncio.TimeoutError:
+            logger.warning(f"Request body stalled or overdue on {scope['path']}")
+            await _reject(scope, receive, send, 408, "Request body timeout")
+            return
+        except ClientDisconnect:
+            return
+        
+        if chunks is None:
+            await _reject(scope, receive, send, 413, "Request body too large")
+            return
+        
+        body = b"".join(chunks)
+        body_sent = False
+        
+        async def receive_buffered() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        
+        await self.app(scope, receive_buffered, send)
+    
+    async def _read_body(self, receive: Receive) -> Optional[List[bytes]]:
+        """
+        Receive the full request body within timeout, waiting at most
+        idle_timeout for each chunk.
+        
+        Args:
+            receive: ASGI receive channel
+        
+        Returns:
+            list: Body chunks, or None if the body exceeds max_bytes
+        
+        Raises:
+            ClientDisconnect: Client went away before finishing the upload
+            asyncio.TimeoutError: The upload stalled or overran its deadline
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        chunks = []
+        size = 0
+        more_body = True
+        
+        while more_body:
+            # One wait per chunk covers both limits, whichever is nearer
+            wait = min(self.idle_timeout, deadline - loop.time())
+            message = await asyncio.wait_for(receive(), wait)
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_bytes:
+                return None
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        
+        return chunks
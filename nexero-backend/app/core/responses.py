@@ -0,0 +1,42 @@
+"""
+JSON response classes for Nexero VR backend.
+
+This module provides an orjson-backed response class used as the default
+for the Unreal Engine endpoints. orjson serializes dicts in C and handles
+datetime/UUID values natively, which is noticeably faster than the stdlib
+json encoder used by FastAPI's default JSONResponse.
+
+FastAPI ships its own ORJSONResponse, but newer releases deprecate it, so
+the backend defines its own equivalent here.
+
+Usage:
+    from app.core.responses import ORJSONResponse
+
+    router = APIRouter(default_response_class=ORJSONResponse)
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+
+    Drop-in replacement for FastAPI's JSONResponse for handlers that
+    return plain dicts.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize response content to JSON bytes.
+
+        Args:
+            content: JSON-serializable response content
+
+        Returns:
+            bytes: Encoded JSON body
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -36,20 +36,31 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.api.v1.unreal import router as unreal_router
+from app.api.v1.unreal import (
+    router as unreal_router,
+    get_database,
+    get_bulk_recorder,
+    get_session_service,
+    get_tracking_service,
+    reset_dependencies
+)
 from app.config import get_settings
-from app.core.database import SupabaseDB
+from app.core.middleware import BufferedBodyMiddleware, GZipRequestMiddleware
+from app.core.responses import ORJSONResponse
 
-# Configure logging with timestamps
+# Configure logging with timestamps (level from LOG_LEVEL, e.g. "warning" in production)
 logging.basicConfig(
-    level=logging.INFO,
+    level=get_settings().LOG_LEVEL.upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every Supabase request at INFO; keep only its warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -69,6 +80,14 @@ async def lifespan(app: FastAPI):
     logger.info("💚 Health Check: http://localhost:8000/health")
     logger.info("=" * 60)
     
+    # Open the shared Supabase connection pool and start the write buffer
+    await get_database().warm_up()
+    await get_bulk_recorder().start()
+    
+    # Build the shared services now so the first VR request doesn't pay for it
+    await get_session_service()
+    await get_tracking_service()
+    
     # ASCII Art
     print("""
     ███╗   ██╗███████╗██╗  ██╗███████╗██████╗  ██████╗ 
@@ -83,7 +102,10 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Shutdown
+    # Shutdown: flush buffered writes before closing the pool
+    await get_bulk_recorder().stop()
+    await get_database().close()
+    reset_dependencies()
     logger.info("=" * 60)
     logger.info("👋 Nexero VR Backend shutting down")
     logger.info("=" * 60)
@@ -98,7 +120,8 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # orjson instead of stdlib json
 )
 
 # Get application settings
@@ -113,6 +136,29 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Compress responses larger than 512 bytes (clients sending Accept-Encoding: gzip)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Accept gzip-compressed batch uploads (Content-Encoding: gzip) from Unreal
+app.add_middleware(
+    GZipRequestMiddleware,
+    paths=("/api/v1/unreal/tracking/batch",),
+    max_bytes=settings.REQUEST_BODY_MAX_BYTES
+)
+
+# Receive upload bodies in full before handlers run, so slow VR clients
+# cannot hold database work open while they upload. Added last, so it runs
+# first: the timeouts and size cap apply to the bytes on the wire, then
+# GZipRequestMiddleware enforces the same REQUEST_BODY_MAX_BYTES cap on the
+# inflated body, so no handler ever sees more than that many bytes.
+app.add_middleware(
+    BufferedBodyMiddleware,
+    paths=("/api/v1/unreal/session", "/api/v1/unreal/tracking/batch"),
+    max_bytes=settings.REQUEST_BODY_MAX_BYTES,
+    timeout=settings.REQUEST_BODY_TIMEOUT_SECONDS,
+    idle_timeout=settings.REQUEST_BODY_IDLE_TIMEOUT_SECONDS
+)
+
 # Include API routers
 app.include_router(
     unreal_router,
@@ -163,7 +209,7 @@ async def health_check():
     """
     try:
         # Test database connection
-        db = SupabaseDB()
+        db = get_database()
         db_status = "connected"
         
         # You could add a simple query here to verify database is responsive
@@ -175,7 +221,7 @@ async def health_check():
     
     return {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "environment": settings.ENVIRONMENT,
         "database": db_status,
         "version": "1.0.0",
@@ -197,7 +243,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc: The exception that was raised
     
     Returns:
-        JSONResponse: Generic error message with 500 status
+        ORJSONResponse: Generic error message with 500 status
     """
     logger.error(
         f"Unhandled exception: {exc}",
@@ -209,12 +255,12 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
             "message": "An unexpected error occurred. Please try again later.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "path": request.url.path
         }
     )
@@ -234,7 +280,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        log_level="info",
+        log_level=settings.LOG_LEVEL,
         reload=True,  # Enable auto-reload for development
         reload_dirs=["app"]  # Watch app directory for changes
     )
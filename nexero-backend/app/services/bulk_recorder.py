@@ -0,0 +1,168 @@
+"""
+Bulk Recorder for Nexero VR Real Estate Platform.
+
+This module buffers database rows in memory and writes them in multi-row
+inserts, so request handlers never wait on a Supabase round-trip for
+fire-and-forget writes such as individual tracking events.
+
+How it works:
+1. Handlers call enqueue(table, row) - returns immediately
+2. One background task per table drains its queue
+3. Rows are flushed when BULK_RECORDER_SIZE rows are buffered or
+   BULK_RECORDER_FLUSH_MS has passed since the first buffered row
+4. On shutdown, any remaining rows are flushed before exit
+
+Usage:
+    from app.services.bulk_recorder import BulkRecorder
+    
+    recorder = BulkRecorder({"tracking_events": db.insert_tracking_events_batch})
+    await recorder.start()
+    
+    recorder.enqueue("tracking_events", event)
+    
+    await recorder.stop()
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List
+
+from app.config import get_settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Coroutine that inserts a list of rows and returns the stored count
+FlushHandler = Callable[[List[dict]], Awaitable[int]]
+
+# Queued by stop() to tell a consumer to flush and exit
+_STOP = object()
+
+
+class BulkRecorder:
+    """
+    In-process write buffer that batches rows per table.
+    
+    Defensive by design: a failed flush is logged and the rows are
+    dropped, and a full queue rejects new rows instead of blocking
+    the request handler.
+    
+    Attributes:
+        bulk_size: Maximum rows per insert
+        flush_interval: Maximum seconds a row waits before being flushed
+    """
+    
+    def __init__(self, flush_handlers: Dict[str, FlushHandler]):
+        """
+        Initialize BulkRecorder with one flush handler per table.
+        
+        Args:
+            flush_handlers: Mapping of table name to a coroutine function
+                that inserts a list of rows into that table
+        """
+        settings = get_settings()
+        self.bulk_size = settings.BULK_RECORDER_SIZE
+        self.flush_interval = settings.BULK_RECORDER_FLUSH_MS / 1000
+        self._flush_handlers = flush_handlers
+        self._queues: Dict[str, asyncio.Queue] = {
+            table: asyncio.Queue(maxsize=settings.BULK_RECORDER_QUEUE_SIZE)
+            for table in flush_handlers
+        }
+        self._tasks: List[asyncio.Task] = []
+    
+    def enqueue(self, table: str, row: dict) -> bool:
+        """
+        Buffer a row for the next bulk insert into table.
+        
+        Never blocks. If the table's queue is full the row is dropped
+        and a warning is logged.
+        
+        Args:
+            table: Target table name (must have a flush handler)
+            row: Row to insert
+        
+        Returns:
+            bool: True if the row was buffered, False if it was dropped
+        """
+        try:
+            self._queues[table].put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Bulk recorder queue full for {table}, dropping row")
+            return False
+    
+    async def start(self) -> None:
+        """
+        Start one background flush task per table.
+        
+        Called once on application startup.
+        """
+        for table, queue in self._queues.items():
+            self._tasks.append(asyncio.create_task(self._consume(table, queue)))
+        logger.info(
+            f"Bulk recorder started: tables={list(self._queues)}, "
+            f"bulk_size={self.bulk_size}, flush_ms={self.flush_interval * 1000:.0f}"
+        )
+    
+    async def stop(self) -> None:
+        """
+        Stop the flush tasks, writing out any buffered rows first.
+        
+        Called once on application shutdown.
+        """
+        for queue in self._queues.values():
+            await queue.put(_STOP)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        logger.info("Bulk recorder stopped")
+    
+    async def _consume(self, table: str, queue: asyncio.Queue) -> None:
+        """
+        Drain a table's queue until stopped, flushing rows in bulk.
+        
+        Args:
+            table: Table the queue belongs to
+            queue: Queue of buffered rows
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        while not stopping:
+            # Wait for the first row, then collect until size or deadline
+            row = await queue.get()
+            if row is _STOP:
+                break
+            rows = [row]
+            deadline = loop.time() + self.flush_interval
+            
+            while len(rows) < self.bulk_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+            
+            await self._flush(table, rows)
+    
+    async def _flush(self, table: str, rows: List[dict]) -> None:
+        """
+        Insert buffered rows with the table's flush handler.
+        
+        Args:
+            table: Target table name
+            rows: Rows to insert
+        """
+        try:
+            stored = await self._flush_handlers[table](rows)
+            logger.debug("Bulk recorder flushed %d/%d rows to %s", stored, len(rows), table)
+        except Exception as e:
+            logger.error(
+                f"Bulk recorder failed to flush {len(rows)} rows to {table}: {e}",
+                exc_info=True
+            )
@@ -10,6 +10,12 @@ Session Lifecycle:
 2. User explores property → tracking events recorded (separate service)
 3. User ends tour → end_session() calculates duration and marks complete
 
+Caching:
+get_session() serves recently seen sessions from a short-lived in-memory
+cache (SESSION_CACHE_TTL_SECONDS), so frequent heartbeat/status checks
+don't hit the database every time. The cache is refreshed whenever this
+service creates or ends a session.
+
 Usage:
     from app.services.session_service import SessionService
     from app.core.database import SupabaseDB
@@ -27,16 +33,88 @@ Usage:
     completed = await service.end_session(session["session_id"])
 """
 
+import asyncio
+import itertools
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from app.config import get_settings
 from app.core.database import SupabaseDB
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+class _SessionCache:
+    """
+    Small TTL cache of session rows keyed by session ID.
+    
+    Only found sessions are cached. When full, the oldest entry is
+    evicted.
+    
+    Every set() or invalidate() gives the session a new generation, so
+    a database lookup that started before the session was changed can
+    tell its result is stale (see set_if_current).
+    """
+    
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: Dict[str, Tuple[float, dict]] = {}
+        self._generations: Dict[str, int] = {}
+        self._counter = itertools.count(1)
+    
+    def get(self, session_id: str) -> Optional[dict]:
+        """Return the cached session, or None if missing or expired."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        expires_at, session = entry
+        if expires_at < time.monotonic():
+            del self._entries[session_id]
+            self._generations.pop(session_id, None)
+            return None
+        return session
+    
+    def generation(self, session_id: str) -> int:
+        """Return the session's current generation (0 if never changed)."""
+        return self._generations.get(session_id, 0)
+    
+    def set(self, session_id: str, session: dict) -> None:
+        """Cache a session for ttl_seconds."""
+        self._entries.pop(session_id, None)
+        if len(self._entries) >= self.max_size:
+            evicted = next(iter(self._entries))
+            del self._entries[evicted]
+            self._generations.pop(evicted, None)
+        self._entries[session_id] = (time.monotonic() + self.ttl_seconds, session)
+        self._generations[session_id] = next(self._counter)
+    
+    def set_if_current(self, session_id: str, session: dict, generation: int) -> bool:
+        """
+        Cache a looked-up session unless it changed since the lookup began.
+        
+        Args:
+            session_id: Session the lookup was for
+            session: Row returned by the lookup
+            generation: generation(session_id) when the lookup started
+        
+        Returns:
+            bool: True if cached, False if the result was stale
+        """
+        if self.generation(session_id) != generation:
+            return False
+        self.set(session_id, session)
+        return True
+    
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session from the cache."""
+        self._entries.pop(session_id, None)
+        self._generations[session_id] = next(self._counter)
+
+
 class SessionService:
     """
     Service layer for VR session management.
@@ -47,6 +125,7 @@ class SessionService:
     
     Attributes:
         db: SupabaseDB instance for database operations
+        cache: Recently seen sessions, sized from settings at construction
     """
     
     def __init__(self, db: SupabaseDB):
@@ -57,6 +136,13 @@ class SessionService:
             db: SupabaseDB instance for data persistence
         """
         self.db = db
+        settings = get_settings()
+        self.cache = _SessionCache(
+            ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+            max_size=settings.SESSION_CACHE_MAX_SIZE
+        )
+        # Database lookups in progress, so concurrent cache misses share one query
+        self._inflight_lookups: Dict[str, asyncio.Future] = {}
         logger.info("SessionService initialized")
     
     async def start_session(
@@ -114,6 +200,8 @@ class SessionService:
             if not created_session:
                 raise Exception("Failed to create session in database")
             
+            self.cache.set(session_id, created_session)
+            
             logger.info(
                 f"Started VR session {session_id} for customer={customer_id}, "
                 f"property={property_id}"
@@ -157,8 +245,9 @@ class SessionService:
             print(f"Session lasted {completed['duration_seconds']} seconds")
         """
         try:
-            # Fetch existing session
-            session = await self.db.get_session(session_id)
+            # Fetch existing session (served from cache when recently
+            # started or polled, so ending usually costs only the UPDATE)
+            session = await self.get_session(session_id)
             
             if not session:
                 error_msg = f"Session not found: {session_id}"
@@ -170,9 +259,8 @@ class SessionService:
                 ended_at = datetime.now(timezone.utc)
             
             # Parse started_at timestamp from database
-            started_at = datetime.fromisoformat(
-                session["started_at"].replace("Z", "+00:00")
-            )
+            # Python 3.11+ fromisoformat accepts the "Z" suffix directly
+            started_at = datetime.fromisoformat(session["started_at"])
             
             # Calculate session duration
             duration = ended_at - started_at
@@ -186,11 +274,14 @@ class SessionService:
             }
             
             # Update session in database
+            self.cache.invalidate(session_id)
             updated_session = await self.db.update_session(session_id, updates)
             
             if not updated_session:
                 raise Exception("Failed to update session in database")
             
+            self.cache.set(session_id, updated_session)
+            
             logger.info(
                 f"Ended VR session {session_id}: duration={duration_seconds}s, "
                 f"status=completed"
@@ -210,7 +301,10 @@ class SessionService:
         Fetch VR session details by ID.
         
         Retrieves complete session information for validation,
-        analytics, or display purposes.
+        analytics, or display purposes. Served from the in-memory
+        cache when the session was looked up within the last
+        SESSION_CACHE_TTL_SECONDS. Concurrent cache misses for the
+        same session wait on a single database query.
         
         Args:
             session_id: UUID of the session to retrieve
@@ -225,9 +319,27 @@ class SessionService:
                 print(f"Duration: {session.get('duration_seconds')}s")
         """
         try:
-            session = await self.db.get_session(session_id)
+            session = self.cache.get(session_id)
+            if session:
+                logger.debug(f"Retrieved session {session_id} from cache")
+                return session
+            
+            # Join a lookup already in flight for this session
+            lookup = self._inflight_lookups.get(session_id)
+            if lookup is not None:
+                return await asyncio.shield(lookup)
+            
+            generation = self.cache.generation(session_id)
+            lookup = asyncio.ensure_future(self.db.get_session(session_id))
+            self._inflight_lookups[session_id] = lookup
+            lookup.add_done_callback(lambda _: self._inflight_lookups.pop(session_id, None))
+            
+            # Shielded so a cancelled request doesn't cancel the shared query
+            session = await asyncio.shield(lookup)
             
             if session:
+                # Skip caching if the session was started/ended meanwhile
+                self.cache.set_if_current(session_id, session, generation)
                 logger.debug(f"Retrieved session {session_id}")
             else:
                 logger.warning(f"Session not found: {session_id}")
@@ -291,10 +403,15 @@ class SessionService:
                 tz=timezone.utc
             )
             
-            logger.info(
-                f"Processing Unreal session data: "
-                f"start={started_at.isoformat()}, end={ended_at.isoformat()}"
-            )
+            # Format each timestamp once for both the log and the record
+            started_iso = started_at.isoformat()
+            ended_iso = ended_at.isoformat()
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Processing Unreal session data: "
+                    f"start={started_iso}, end={ended_iso}"
+                )
             
             # Generate session ID
             session_id = str(uuid.uuid4())
@@ -306,20 +423,23 @@ class SessionService:
             # Create complete session data
             session_data = {
                 "id": session_id,
-                "started_at": started_at.isoformat(),
-                "ended_at": ended_at.isoformat(),
+                "started_at": started_iso,
+                "ended_at": ended_iso,
                 "duration_seconds": duration_seconds,
                 "status": "completed",
                 "customer_id": customer_id,
                 "property_id": property_id
             }
             
-            # Insert complete session into database
+            # Insert complete session in one round trip; the insert
+            # returns the stored row, and duration is computed above
             created_session = await self.db.create_session(session_data)
             
             if not created_session:
                 raise Exception("Failed to create session in database")
             
+            self.cache.set(session_id, created_session)
+            
             logger.info(
                 f"Processed Unreal session {session_id}: "
                 f"duration={duration_seconds}s, status=completed"
@@ -25,15 +25,25 @@ Usage:
     # Process batch of events after session ends
     result = await service.log_events_batch(session_id, events)
     print(f"Stored {result['successful_count']} events")
+    
+    # Buffer a single live event for the next bulk insert
+    service.enqueue_event(session_id, event)
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence
+from pydantic import TypeAdapter
+from app.config import get_settings
 from app.core.database import SupabaseDB
+from app.models.unreal import TrackingEventFromUnreal
+from app.services.bulk_recorder import BulkRecorder
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Dumps a whole list of events in one call into pydantic-core
+_EVENTS_ADAPTER = TypeAdapter(List[TrackingEventFromUnreal])
+
 
 class TrackingService:
     """
@@ -50,16 +60,23 @@ class TrackingService:
     
     Attributes:
         db: SupabaseDB instance for database operations
+        recorder: Optional BulkRecorder used by enqueue_event
+        pending_batch_events: Batch events accepted for background storage
+            but not yet stored
     """
     
-    def __init__(self, db: SupabaseDB):
+    def __init__(self, db: SupabaseDB, recorder: Optional[BulkRecorder] = None):
         """
         Initialize TrackingService with database connection.
         
         Args:
             db: SupabaseDB instance for data persistence
+            recorder: Optional BulkRecorder for buffered single-event writes
         """
         self.db = db
+        self.recorder = recorder
+        self.pending_batch_events = 0
+        self._max_pending_batch_events = get_settings().TRACKING_BACKLOG_MAX_EVENTS
         logger.info("TrackingService initialized")
     
     async def log_event(self, session_id: str, event_data: dict) -> bool:
@@ -91,18 +108,10 @@ class TrackingService:
             )
         """
         try:
-            # Validate required field
-            if "event_type" not in event_data:
-                logger.warning(
-                    f"Missing event_type in event data for session {session_id}. "
-                    f"Skipping event."
-                )
+            # Validate required field and ensure session_id is in event data
+            if not self._build_event_record(session_id, event_data):
                 return False
             
-            # Ensure session_id is in event data
-            if "session_id" not in event_data:
-                event_data["session_id"] = session_id
-            
             # Add timestamp if not present (use database default)
             # Database will handle timestamp if not provided
             
@@ -111,8 +120,8 @@ class TrackingService:
             
             if success:
                 logger.debug(
-                    f"Logged event: session={session_id}, "
-                    f"type={event_data['event_type']}"
+                    "Logged event: session=%s, type=%s",
+                    session_id, event_data["event_type"]
                 )
             else:
                 logger.warning(
@@ -130,10 +139,68 @@ class TrackingService:
             )
             return False
     
+    def enqueue_event(self, session_id: str, event_data: dict) -> bool:
+        """
+        Buffer a single tracking event for the next bulk insert.
+        
+        Non-blocking alternative to log_event for live event streams:
+        the event is handed to the BulkRecorder and written together
+        with other buffered events, so the caller never waits on the
+        database.
+        
+        Args:
+            session_id: UUID of the VR session
+            event_data: Dictionary containing event information
+                (same shape as log_event)
+        
+        Returns:
+            bool: True if the event was buffered, False otherwise
+            
+        Example:
+            service.enqueue_event(
+                session_id="session_abc123",
+                event_data={"event_type": "gaze", "zone_name": "kitchen"}
+            )
+        """
+        if self.recorder is None:
+            logger.warning("No bulk recorder configured, event not buffered")
+            return False
+        
+        if not self._build_event_record(session_id, event_data):
+            return False
+        
+        return self.recorder.enqueue("tracking_events", event_data)
+    
+    @staticmethod
+    def _build_event_record(session_id: str, event_data: dict) -> bool:
+        """
+        Validate a single event and fill in its session_id in place.
+        
+        Shared by log_event and enqueue_event.
+        
+        Args:
+            session_id: UUID of the VR session
+            event_data: Event dictionary to check and complete
+        
+        Returns:
+            bool: True if the event can be stored, False if it lacks event_type
+        """
+        if "event_type" not in event_data:
+            logger.warning(
+                f"Missing event_type in event data for session {session_id}. "
+                f"Skipping event."
+            )
+            return False
+        
+        if event_data.get("session_id") is None:
+            event_data["session_id"] = session_id
+        
+        return True
+    
     async def log_events_batch(
         self,
         session_id: str,
-        events: List[dict]
+        events: Sequence[TrackingEventFromUnreal]
     ) -> dict:
         """
         Store multiple tracking events efficiently in a batch.
@@ -142,9 +209,13 @@ class TrackingService:
         after the VR session ends. Optimized for bulk processing with
         error tolerance to maximize data capture.
         
+        Takes the validated models directly and dumps the whole list
+        to database rows in a single serializer call, instead of one
+        model_dump() call per event.
+        
         Args:
             session_id: UUID of the VR session
-            events: List of event dictionaries to store
+            events: Validated tracking events to store
         
         Returns:
             dict: Processing results with:
@@ -154,13 +225,7 @@ class TrackingService:
                 - success_rate: Percentage of successful insertions
                 
         Example:
-            events = [
-                {"event_type": "gaze", "zone_name": "kitchen", ...},
-                {"event_type": "zone_enter", "zone_name": "bedroom", ...},
-                {"event_type": "interaction", "object_name": "window", ...}
-            ]
-            
-            result = await service.log_events_batch("session_abc123", events)
+            result = await service.log_events_batch("session_abc123", batch.events)
             print(f"Stored {result['successful_count']}/{result['total_events']} events")
         """
         try:
@@ -175,27 +240,24 @@ class TrackingService:
                     "success_rate": 0.0
                 }
             
-            # Ensure all events have session_id
-            for event in events:
-                if "session_id" not in event:
-                    event["session_id"] = session_id
-                
-                # Validate event_type (log warning but include anyway)
-                if "event_type" not in event:
-                    logger.warning(
-                        f"Event missing event_type in session {session_id}, "
-                        f"event data: {event}"
-                    )
+            # Build database rows, filling in the batch session_id
+            rows = _EVENTS_ADAPTER.dump_python(events)
+            for row in rows:
+                if row["session_id"] is None:
+                    row["session_id"] = session_id
             
-            # Batch insert events
-            successful_count = await self.db.insert_tracking_events_batch(events)
+            # Batch insert events (rows are ours, so no defensive copy)
+            successful_count = await self.db.insert_tracking_events_batch(
+                rows,
+                copy=False
+            )
             failed_count = total_events - successful_count
             success_rate = (successful_count / total_events * 100) if total_events > 0 else 0
             
             logger.info(
-                f"Batch processed for session {session_id}: "
-                f"{successful_count}/{total_events} events stored "
-                f"({success_rate:.1f}% success rate)"
+                "Batch processed for session %s: %d/%d events stored "
+                "(%.1f%% success rate)",
+                session_id, successful_count, total_events, success_rate
             )
             
             result = {
@@ -220,6 +282,54 @@ class TrackingService:
                 "success_rate": 0.0
             }
     
+    def reserve_background_batch(self, event_count: int) -> bool:
+        """
+        Reserve backlog room for a batch to be stored in the background.
+        
+        Keeps memory bounded when batches arrive faster than they can be
+        stored: once TRACKING_BACKLOG_MAX_EVENTS events are waiting, the
+        caller should store the batch before replying instead.
+        
+        Args:
+            event_count: Number of events in the batch
+        
+        Returns:
+            bool: True if reserved (call store_background_batch later),
+                  False if the backlog is full
+        """
+        if self.pending_batch_events + event_count > self._max_pending_batch_events:
+            logger.warning(
+                f"Tracking backlog full ({self.pending_batch_events} events pending), "
+                f"storing batch before replying"
+            )
+            return False
+        
+        self.pending_batch_events += event_count
+        return True
+    
+    async def store_background_batch(
+        self,
+        session_id: str,
+        events: Sequence[TrackingEventFromUnreal]
+    ) -> dict:
+        """
+        Store a batch reserved with reserve_background_batch.
+        
+        Same as log_events_batch, but releases the batch's backlog
+        reservation once it is stored.
+        
+        Args:
+            session_id: UUID of the VR session
+            events: Validated tracking events to store
+        
+        Returns:
+            dict: Processing results (see log_events_batch)
+        """
+        try:
+            return await self.log_events_batch(session_id, events)
+        finally:
+            self.pending_batch_events -= len(events)
+    
     async def get_session_events(
         self,
         session_id: str,
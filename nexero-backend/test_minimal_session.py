@@ -2,22 +2,30 @@
 Test minimal session payload - only timestamps, no customer/property IDs
 """
 
-import requests
+import httpx
 import json
 from datetime import datetime, timezone
 
 BASE_URL = "http://localhost:8000"
+BAR = "=" * 70
 
-print("=" * 70)
+# Reuse one keep-alive connection for every call, retrying failed connects.
+# Connecting fails fast; responses get the longer read budget.
+client = httpx.Client(
+    timeout=httpx.Timeout(10.0, connect=5.0),
+    transport=httpx.HTTPTransport(retries=2)
+)
+
+print(BAR)
 print(" TESTING MINIMAL SESSION PAYLOAD ".center(70))
 print(" (Only timestamps, no customer_id or property_id) ".center(70))
-print("=" * 70)
+print(BAR)
 print()
 
 # Test 1: Health check
 print("1. Testing health endpoint...")
 try:
-    response = requests.get(f"{BASE_URL}/health", timeout=5)
+    response = client.get(f"{BASE_URL}/health")
     print(f"✓ Health check: {response.status_code}")
 except Exception as e:
     print(f"✗ Backend not running: {e}")
@@ -43,15 +51,15 @@ print(json.dumps(minimal_session, indent=2))
 print()
 
 try:
-    response = requests.post(
+    response = client.post(
         f"{BASE_URL}/api/v1/unreal/session",
-        json=minimal_session,
-        timeout=10
+        json=minimal_session
     )
     
     print(f"Response Status: {response.status_code}")
     print(f"Response Body:")
-    print(json.dumps(response.json(), indent=2))
+    response_data = response.json()
+    print(json.dumps(response_data, indent=2))
     print()
     
     if response.status_code == 201:
@@ -59,14 +67,13 @@ try:
         print()
         print("Your system is NOT hardcoded!")
         print("You can send sessions with only timestamps for testing.")
-        session_id = response.json().get("session_id")
+        session_id = response_data.get("session_id")
         print(f"\nSession ID: {session_id}")
         
         # Verify in database
         print("\n3. Verifying session status...")
-        status_response = requests.get(
-            f"{BASE_URL}/api/v1/unreal/session/{session_id}/status",
-            timeout=5
+        status_response = client.get(
+            f"{BASE_URL}/api/v1/unreal/session/{session_id}/status"
         )
         print(f"Response Status: {status_response.status_code}")
         print(json.dumps(status_response.json(), indent=2))
@@ -81,6 +88,6 @@ except Exception as e:
     print(f"✗ Error: {e}")
 
 print()
-print("=" * 70)
+print(BAR)
 print(" TEST COMPLETE ".center(70))
-print("=" * 70)
+print(BAR)
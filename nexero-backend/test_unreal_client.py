@@ -8,7 +8,7 @@ Usage:
     python test_unreal_client.py
 
 Requirements:
-    pip install requests
+    pip install httpx orjson
 """
 
 import json
@@ -17,13 +17,26 @@ import time
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
 
-import requests
+import httpx
+import orjson
 
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_VERSION = "v1"
 
+# One keep-alive client for every call, so the script doesn't open a
+# new TCP/TLS connection per request (noticeable against remote deploys).
+# Failed connection attempts are retried, e.g. while a deploy wakes up;
+# connecting fails fast while slow responses get the longer read budget.
+client = httpx.Client(
+    timeout=httpx.Timeout(25.0, connect=5.0),
+    transport=httpx.HTTPTransport(retries=2)
+)
+
+# Headers for pre-encoded JSON bodies (see post_json)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -37,26 +50,45 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Separator line used by headers
+BAR = "=" * 70
+
+
 def print_header(text: str):
     """Print formatted header."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}")
+    print(f"\n{Colors.HEADER}{Colors.BOLD}{BAR}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{text.center(70)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}\n")
+    print(f"{Colors.HEADER}{Colors.BOLD}{BAR}{Colors.ENDC}\n")
+
+
+# Message prefixes, built once
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✓ "
+_ERROR_PREFIX = f"{Colors.FAIL}✗ "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ "
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+    print(_SUCCESS_PREFIX, text, Colors.ENDC, sep="")
 
 
 def print_error(text: str):
     """Print error message."""
-    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+    print(_ERROR_PREFIX, text, Colors.ENDC, sep="")
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
+    print(_INFO_PREFIX, text, Colors.ENDC, sep="")
+
+
+def post_json(url: str, data: Dict[str, Any]) -> httpx.Response:
+    """POST a JSON payload encoded with orjson (faster on large batches)."""
+    return client.post(
+        url,
+        content=orjson.dumps(data),
+        headers=JSON_HEADERS
+    )
 
 
 def test_session_endpoint() -> str:
@@ -89,15 +121,16 @@ def test_session_endpoint() -> str:
         
         # Send POST request
         url = f"{BASE_URL}/api/{API_VERSION}/unreal/session"
-        response = requests.post(url, json=session_data)
+        response = post_json(url, session_data)
         
         # Check response
         print(f"\nResponse Status: {response.status_code}")
         print("Response Body:")
-        print(json.dumps(response.json(), indent=2))
+        response_data = response.json()
+        print(json.dumps(response_data, indent=2))
         
         if response.status_code == 201:
-            session_id = response.json().get("session_id")
+            session_id = response_data.get("session_id")
             print_success(f"Session created successfully! ID: {session_id}")
             return session_id
         else:
@@ -126,7 +159,7 @@ def test_tracking_event(session_id: str):
         # Create tracking event
         event_data = {
             "event_type": "zone_enter",
-            "timestamp": datetime.now(timezone.utc).timestamp(),
+            "timestamp": time.time(),
             "session_id": session_id,
             "zone_name": "kitchen",
             "position": {
@@ -146,7 +179,7 @@ def test_tracking_event(session_id: str):
         
         # Send POST request
         url = f"{BASE_URL}/api/{API_VERSION}/unreal/tracking/event"
-        response = requests.post(url, json=event_data)
+        response = post_json(url, event_data)
         
         print(f"\nResponse Status: {response.status_code}")
         print("Response Body:")
@@ -234,7 +267,7 @@ def test_tracking_batch(session_id: str):
         
         batch_data = {
             "session_id": session_id,
-            "sent_at": datetime.now(timezone.utc).timestamp(),
+            "sent_at": time.time(),
             "events": events
         }
         
@@ -243,7 +276,7 @@ def test_tracking_batch(session_id: str):
         
         # Send POST request
         url = f"{BASE_URL}/api/{API_VERSION}/unreal/tracking/batch"
-        response = requests.post(url, json=batch_data)
+        response = post_json(url, batch_data)
         
         print(f"\nResponse Status: {response.status_code}")
         print("Response Body:")
@@ -251,12 +284,10 @@ def test_tracking_batch(session_id: str):
         print(json.dumps(response_data, indent=2))
         
         if response.status_code == 202:
-            processed = response_data.get("processed", 0)
             total = response_data.get("total_events", 0)
-            success_rate = response_data.get("success_rate", 0)
             print_success(
-                f"Batch processed! {processed}/{total} events stored "
-                f"({success_rate:.1f}% success rate)"
+                f"Batch accepted! {total} events queued for storage "
+                f"(check backend logs for storage results)"
             )
         else:
             print_error(f"Failed to send batch: {response.status_code}")
@@ -283,14 +314,14 @@ def test_session_status(session_id: str):
         
         # Send GET request
         url = f"{BASE_URL}/api/{API_VERSION}/unreal/session/{session_id}/status"
-        response = requests.get(url)
+        response = client.get(url)
         
         print(f"\nResponse Status: {response.status_code}")
         print("Response Body:")
-        print(json.dumps(response.json(), indent=2))
+        status_data = response.json()
+        print(json.dumps(status_data, indent=2))
         
         if response.status_code == 200:
-            status_data = response.json()
             print_success(f"Session status: {status_data.get('status')}")
         else:
             print_error(f"Failed to get session status: {response.status_code}")
@@ -317,7 +348,7 @@ def test_heartbeat(session_id: str):
         
         # Send POST request
         url = f"{BASE_URL}/api/{API_VERSION}/unreal/session/{session_id}/heartbeat"
-        response = requests.post(url)
+        response = client.post(url)
         
         print(f"\nResponse Status: {response.status_code}")
         print("Response Body:")
@@ -375,18 +406,17 @@ def simulate_vr_session():
         print_info("\nStep 3: Sending all tracking data in batch...")
         batch_data = {
             "session_id": session_id,
-            "sent_at": datetime.now(timezone.utc).timestamp(),
+            "sent_at": time.time(),
             "events": events
         }
         
         url = f"{BASE_URL}/api/{API_VERSION}/unreal/tracking/batch"
-        response = requests.post(url, json=batch_data)
+        response = post_json(url, batch_data)
         
         if response.status_code == 202:
             result = response.json()
             print_success(
-                f"Batch sent! {result['processed']}/{result['total_events']} "
-                f"events stored ({result['success_rate']:.1f}% success)"
+                f"Batch sent! {result['total_events']} events queued for storage"
             )
         else:
             print_error(f"Batch failed: {response.status_code}")
@@ -408,13 +438,18 @@ def simulate_vr_session():
         print_error(f"Error in VR session simulation: {e}")
 
 
-def test_health_check():
-    """Test the health check endpoint."""
+def test_health_check() -> bool:
+    """
+    Test the health check endpoint.
+    
+    Returns:
+        bool: True if the backend answered healthy
+    """
     print_header("TEST 0: Health Check")
     
     try:
         url = f"{BASE_URL}/health"
-        response = requests.get(url)
+        response = client.get(url)
         
         print(f"Response Status: {response.status_code}")
         print("Response Body:")
@@ -422,12 +457,15 @@ def test_health_check():
         
         if response.status_code == 200:
             print_success("Backend is healthy!")
+            return True
         else:
             print_error("Backend health check failed!")
+            return False
             
     except Exception as e:
         print_error(f"Cannot connect to backend: {e}")
         print_info("Make sure the backend is running: python app/main.py")
+        return False
 
 
 def main():
@@ -435,36 +473,31 @@ def main():
     Run all tests in sequence.
     """
     print(f"\n{Colors.BOLD}{Colors.HEADER}")
-    print("=" * 70)
+    print(BAR)
     print("     NEXERO VR BACKEND - TEST CLIENT     ".center(70))
     print("     Simulating Unreal Engine VR Client     ".center(70))
-    print("=" * 70)
+    print(BAR)
     print(f"{Colors.ENDC}\n")
     
-    # Test 0: Health check
-    test_health_check()
-    time.sleep(1)
+    # Test 0: Health check (the remaining tests need a running backend)
+    if not test_health_check():
+        return
     
     # Test 1: Create session
     session_id = test_session_endpoint()
-    time.sleep(1)
     
     if session_id:
         # Test 2: Single event
         test_tracking_event(session_id)
-        time.sleep(1)
         
         # Test 3: Batch events
         test_tracking_batch(session_id)
-        time.sleep(1)
         
         # Test 4: Session status
         test_session_status(session_id)
-        time.sleep(1)
         
         # Test 5: Heartbeat
         test_heartbeat(session_id)
-        time.sleep(2)
     
     # Full simulation
     simulate_vr_session()
@@ -0,0 +1,30 @@
+"""
+Application lifespan tests.
+
+Startup warms up the database connection; with no Supabase reachable
+the warm-up just logs a warning, so these tests run offline.
+"""
+
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from app.api.v1.unreal import get_database
+from app.main import app
+
+
+def test_app_can_start_twice_in_one_process():
+    databases = []
+    
+    for _ in range(2):
+        with TestClient(app) as client:
+            db = get_database()
+            databases.append(db)
+            
+            # The query thread pool must be usable, not left shut down
+            assert client.portal.call(db._run, lambda: "ok") == "ok"
+    
+    assert databases[0] is not databases[1]
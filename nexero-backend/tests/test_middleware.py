@@ -0,0 +1,64 @@
+"""
+BufferedBodyMiddleware tests, driven directly over ASGI.
+"""
+
+import asyncio
+
+from app.core.middleware import BufferedBodyMiddleware
+
+
+PATH = "/api/v1/unreal/tracking/batch"
+
+
+async def echo_app(scope, receive, send):
+    """Reply 200 with the number of body bytes received."""
+    message = await receive()
+    size = str(len(message["body"])).encode()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": size})
+
+
+def run_upload(middleware, chunks, delay):
+    """Send chunks with a delay before each, returning (status, body)."""
+    async def scenario():
+        pending = list(chunks)
+        sent = []
+        
+        async def receive():
+            if not pending:
+                await asyncio.sleep(3600)
+            await asyncio.sleep(delay)
+            chunk = pending.pop(0)
+            return {"type": "http.request", "body": chunk, "more_body": bool(pending)}
+        
+        async def send(message):
+            sent.append(message)
+        
+        scope = {"type": "http", "method": "POST", "path": PATH, "headers": []}
+        await middleware(scope, receive, send)
+        return sent[0]["status"], sent[-1].get("body", b"")
+    
+    return asyncio.run(scenario())
+
+
+def test_slow_but_steady_upload_is_not_cut_off():
+    # Takes longer overall than any single chunk gap is allowed
+    middleware = BufferedBodyMiddleware(echo_app, paths=(PATH,), timeout=5.0, idle_timeout=0.05)
+    status, body = run_upload(middleware, [b"x" * 10] * 10, delay=0.02)
+    
+    assert status == 200
+    assert body == b"100"
+
+
+def test_stalled_upload_times_out():
+    middleware = BufferedBodyMiddleware(echo_app, paths=(PATH,), timeout=5.0, idle_timeout=0.05)
+    status, _ = run_upload(middleware, [b"x", b"y"], delay=0.2)
+    
+    assert status == 408
+
+
+def test_trickling_upload_hits_overall_deadline():
+    middleware = BufferedBodyMiddleware(echo_app, paths=(PATH,), timeout=0.1, idle_timeout=1.0)
+    status, _ = run_upload(middleware, [b"x"] * 20, delay=0.02)
+    
+    assert status == 408
@@ -0,0 +1,70 @@
+"""
+SessionService cache tests, run against an in-memory fake database.
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+from app.services.session_service import SessionService
+
+
+class FakeDB:
+    """Minimal stand-in for SupabaseDB with controllable timing."""
+    
+    def __init__(self):
+        self.rows = {}
+        self.lookup_started = asyncio.Event()
+        self.release_lookup = asyncio.Event()
+        self.release_update = asyncio.Event()
+        self.block = False
+    
+    async def create_session(self, session_data):
+        self.rows[session_data["id"]] = dict(session_data)
+        return dict(session_data)
+    
+    async def get_session(self, session_id):
+        row = dict(self.rows[session_id])  # read before any pending update lands
+        if self.block:
+            self.lookup_started.set()
+            await self.release_lookup.wait()
+        return row
+    
+    async def update_session(self, session_id, updates):
+        if self.block:
+            await self.release_update.wait()
+        self.rows[session_id].update(updates)
+        return dict(self.rows[session_id])
+
+
+def test_stale_lookup_does_not_overwrite_ended_session():
+    async def scenario():
+        db = FakeDB()
+        service = SessionService(db)
+        session = await service.start_session()
+        session_id = session["id"]
+        
+        db.block = True
+        end_task = asyncio.create_task(service.end_session(session_id))
+        await asyncio.sleep(0)  # end_session has invalidated and is updating
+        
+        # A heartbeat misses the cache and reads the old "active" row
+        lookup_task = asyncio.create_task(service.get_session(session_id))
+        await db.lookup_started.wait()
+        
+        db.release_update.set()
+        ended = await end_task
+        db.release_lookup.set()
+        looked_up = await lookup_task
+        
+        assert ended["status"] == "completed"
+        assert looked_up["status"] == "active"
+        
+        # The stale lookup result must not replace the ended session
+        db.block = False
+        db.rows[session_id]["status"] = "sentinel"  # cache hit won't see this
+        assert (await service.get_session(session_id))["status"] == "completed"
+    
+    asyncio.run(scenario())
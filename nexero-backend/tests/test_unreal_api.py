@@ -0,0 +1,59 @@
+"""
+Request body parsing tests for the Unreal Engine API endpoints.
+
+The app is exercised without its lifespan and with the service
+dependencies stubbed out, so no Supabase connection is needed.
+"""
+
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1.unreal import get_session_service, get_tracking_service
+from app.main import app
+
+JSON_ENDPOINTS = (
+    "/api/v1/unreal/session",
+    "/api/v1/unreal/tracking/event",
+    "/api/v1/unreal/tracking/batch",
+)
+
+
+@pytest.fixture
+def client():
+    """Test client with the database-backed services stubbed out."""
+    app.dependency_overrides[get_session_service] = lambda: None
+    app.dependency_overrides[get_tracking_service] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", JSON_ENDPOINTS)
+def test_non_utf8_body_is_rejected_with_400(client, path):
+    response = client.post(
+        path,
+        content=b"\xff\xfe{",
+        headers={"content-type": "application/json"}
+    )
+    
+    assert response.status_code == 400
+    assert response.json() == {"detail": "There was an error parsing the body"}
+
+
+@pytest.mark.parametrize("path", JSON_ENDPOINTS)
+def test_invalid_json_does_not_echo_body(client, path):
+    response = client.post(
+        path,
+        content=b"{not json",
+        headers={"content-type": "application/json"}
+    )
+    
+    assert response.status_code == 422
+    error, = response.json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body"]
+    assert error["input"] == {}